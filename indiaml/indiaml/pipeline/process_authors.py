@@ -1,6 +1,6 @@
 from sqlalchemy.orm import Session, joinedload
 from datetime import datetime, timezone
-from typing import List
+from typing import Dict, List
 from ..venue.venudao import VenueDB
 from ..models.models import PaperAuthor, Paper, Author
 from ..models.dto import AuthorDTO
@@ -20,6 +20,33 @@ handler.setFormatter(formatter)
 logger.addHandler(handler)
 
 
+def fetch_detailed_authors(adapter, raw_authors: List[dict], profile_cache: Dict[str, AuthorDTO]) -> List[AuthorDTO]:
+    """
+    Fetch detailed authors for a paper, only asking the adapter for ids not in `profile_cache`.
+
+    The adapter returns an empty list both on errors and when none of the ids has a
+    profile. If that happens while some of the paper's ids were served from the cache,
+    the full id list is fetched instead, so the result matches an uncached fetch.
+    An empty result makes the caller fall back to the raw authors for the whole paper.
+    """
+    author_ids = [author.get('openreview_id') for author in raw_authors if 'openreview_id' in author]
+    unique_ids = list(dict.fromkeys(author_ids))
+    missing_ids = [aid for aid in unique_ids if aid not in profile_cache]
+    if missing_ids:
+        fetched_authors = adapter.fetch_authors(missing_ids)
+        if not fetched_authors:
+            if len(missing_ids) == len(unique_ids):
+                return []
+            # Can't tell an error from "no profiles" here, so redo the uncached call
+            fetched_authors = adapter.fetch_authors(author_ids)
+            for author_dto in fetched_authors:
+                profile_cache[author_dto.openreview_id] = author_dto
+            return fetched_authors
+        for author_dto in fetched_authors:
+            profile_cache[author_dto.openreview_id] = author_dto
+    return [profile_cache[aid] for aid in author_ids if aid in profile_cache]
+
+
 def process_authors():
     """Process authors from stored papers and save them to the database."""
     try:
@@ -32,6 +59,10 @@ def process_authors():
 
             logger.info(f"Processing authors for {len(papers)} papers.")
 
+            # Authors recur across papers, so fetch each OpenReview profile and
+            # resolve each Author row only once per run.
+            profile_cache: Dict[str, AuthorDTO] = {}
+            author_cache: Dict[str, Author] = {}
 
             for paper in papers:
                 logger.debug(f"Processing paper ID: {paper.id}")
@@ -62,10 +93,9 @@ def process_authors():
                 # Get the appropriate adapter
                 adapter = get_adapter(venue_config)
                 
-                # Fetch detailed author information using the adapter
-                detailed_authors = adapter.fetch_authors(
-                    [author.get('openreview_id') for author in paper.raw_authors if 'openreview_id' in author]
-                )
+                # Fetch detailed author information using the adapter, skipping
+                # profiles already fetched for an earlier paper
+                detailed_authors = fetch_detailed_authors(adapter, paper.raw_authors, profile_cache)
 
 
                 if not detailed_authors:
@@ -92,7 +122,14 @@ def process_authors():
 
                 for idx, author_dto in enumerate(detailed_authors):
                     try:
-                        author = db.get_or_create_author(author_dto)
+                        # Only profile-backed authors are cached; raw fallbacks
+                        # still go through get_or_create_author every time
+                        cacheable = profile_cache.get(author_dto.openreview_id) is author_dto
+                        author = author_cache.get(author_dto.openreview_id) if cacheable else None
+                        if author is None:
+                            author = db.get_or_create_author(author_dto)
+                            if cacheable:
+                                author_cache[author_dto.openreview_id] = author
                         
                         # Create or update PaperAuthor association with sequence position
                         paper_author = session.query(PaperAuthor).filter_by(
@@ -18,6 +18,22 @@ if not logger.handlers:
     logger.addHandler(handler)
 
 
+# Stay well below SQLite's bound-parameter limit
+IN_CLAUSE_BATCH_SIZE = 500
+
+
+def _fetch_authors_in(session: Session, column, values) -> List[Author]:
+    """
+    Fetch all Authors whose `column` value is in `values`, batching the IN clause.
+    """
+    values = list(values)
+    authors: List[Author] = []
+    for start in range(0, len(values), IN_CLAUSE_BATCH_SIZE):
+        batch = values[start:start + IN_CLAUSE_BATCH_SIZE]
+        authors.extend(session.query(Author).filter(column.in_(batch)).all())
+    return authors
+
+
 def create_paper_authors():
     """
     Populate the PaperAuthor table with paper-author associations and affiliation details.
@@ -36,6 +52,20 @@ def create_paper_authors():
 
             logger.info(f"Found {len(papers)} papers in the database.")
 
+            # Load every referenced Author up front with batched IN (...) queries
+            # instead of one SELECT per raw author
+            openreview_ids = {a.get('openreview_id') for p in papers for a in (p.raw_authors or []) if a.get('openreview_id')}
+            emails = {a.get('email') for p in papers for a in (p.raw_authors or []) if a.get('email')}
+            authors_by_openreview_id = {
+                author.openreview_id: author
+                for author in _fetch_authors_in(session, Author.openreview_id, openreview_ids)
+            }
+            authors_by_email = {
+                author.email: author
+                for author in _fetch_authors_in(session, Author.email, emails)
+            }
+            logger.info(f"Prefetched {len(authors_by_openreview_id)} authors by OpenReview ID and {len(authors_by_email)} by email.")
+
             for paper in papers:
                 logger.debug(f"Processing Paper ID: {paper.id}")
 
@@ -58,9 +88,9 @@ def create_paper_authors():
 
                     # Fetch the Author object based on openreview_id or email
                     if openreview_id:
-                        author = session.query(Author).filter_by(openreview_id=openreview_id).one_or_none()
+                        author = authors_by_openreview_id.get(openreview_id)
                     if not author and 'email' in author_data and author_data['email']:
-                        author = session.query(Author).filter_by(email=author_data['email']).one_or_none()
+                        author = authors_by_email.get(author_data['email'])
 
                     if not author:
                         logger.warning(f"Author not found for Paper ID: {paper.id} with data: {author_data}")
@@ -0,0 +1,79 @@
+import unittest
+from typing import List
+from indiaml.models.dto import AuthorDTO
+from indiaml.pipeline.process_authors import fetch_detailed_authors
+
+
+class StubAdapter:
+    """Returns a profile for every requested '~' id; email-style ids have no profile."""
+
+    def __init__(self):
+        self.calls: List[List[str]] = []
+
+    def fetch_authors(self, author_ids: List[str]) -> List[AuthorDTO]:
+        self.calls.append(list(author_ids))
+        return [
+            AuthorDTO(name=aid.strip('~'), openreview_id=aid, history=[])
+            for aid in author_ids if aid.startswith('~')
+        ]
+
+
+class FailingAdapter(StubAdapter):
+    """Fails on every call the way NeurIPSAdapter does, by swallowing the error and returning []."""
+
+    def fetch_authors(self, author_ids: List[str]) -> List[AuthorDTO]:
+        self.calls.append(list(author_ids))
+        return []
+
+
+class TestFetchDetailedAuthors(unittest.TestCase):
+    def setUp(self):
+        self.profile_cache = {}
+        self.paper1_authors = [{'name': 'A', 'openreview_id': '~A1'}, {'name': 'B', 'openreview_id': '~B1'}]
+        self.paper2_authors = [{'name': 'C', 'openreview_id': '~C1'}, {'name': 'A', 'openreview_id': '~A1'}]
+
+    def test_cached_profiles_are_not_refetched(self):
+        adapter = StubAdapter()
+        fetch_detailed_authors(adapter, self.paper1_authors, self.profile_cache)
+        result = fetch_detailed_authors(adapter, self.paper2_authors, self.profile_cache)
+
+        self.assertEqual([a.openreview_id for a in result], ['~C1', '~A1'])
+        self.assertEqual(adapter.calls, [['~A1', '~B1'], ['~C1']])
+
+    def test_fully_cached_paper_skips_adapter(self):
+        adapter = StubAdapter()
+        fetch_detailed_authors(adapter, self.paper1_authors, self.profile_cache)
+        result = fetch_detailed_authors(adapter, list(reversed(self.paper1_authors)), self.profile_cache)
+
+        self.assertEqual([a.openreview_id for a in result], ['~B1', '~A1'])
+        self.assertEqual(len(adapter.calls), 1)
+
+    def test_author_without_profile_next_to_cached_author(self):
+        # Matches an uncached fetch: only ~A1 comes back, at index 0
+        adapter = StubAdapter()
+        fetch_detailed_authors(adapter, [{'name': 'A', 'openreview_id': '~A1'}], self.profile_cache)
+        paper_authors = [{'name': 'Bob', 'openreview_id': 'bob@x.org'}, {'name': 'A', 'openreview_id': '~A1'}]
+        result = fetch_detailed_authors(adapter, paper_authors, self.profile_cache)
+
+        self.assertEqual([a.openreview_id for a in result], ['~A1'])
+        self.assertNotIn('bob@x.org', self.profile_cache)
+
+    def test_failed_fetch_with_cached_author_returns_empty(self):
+        # Lets process_authors fall back to raw authors for the whole paper
+        self.profile_cache['~A1'] = AuthorDTO(name='A1', openreview_id='~A1', history=[])
+        adapter = FailingAdapter()
+        result = fetch_detailed_authors(adapter, self.paper2_authors, self.profile_cache)
+
+        self.assertEqual(result, [])
+        self.assertEqual(adapter.calls, [['~C1'], ['~C1', '~A1']])
+
+    def test_failed_fetch_without_cached_authors_returns_empty(self):
+        adapter = FailingAdapter()
+        result = fetch_detailed_authors(adapter, self.paper1_authors, self.profile_cache)
+
+        self.assertEqual(result, [])
+        self.assertEqual(len(adapter.calls), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()